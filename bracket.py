@@ -9,27 +9,101 @@ teams and their seeds, and rendering a visual bracket with team logos.
 
 from bracket_node import BracketNode
 from collections import defaultdict
-from matplotlib.lines import Line2D
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
 from round import Round
 from team import Team
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 from PIL import Image
+import functools
+import math
 import numpy as np
-import matplotlib.pyplot as plt
 
 # Module-level constants
 IMG_WIDTH = 1600
 IMG_HEIGHT = 600
 DPI = 100
+LINE_WIDTH = 1
+# Half a line's width in pixels; `LINE_WIDTH` is in points, 1/72 inch each
+LINE_HALF_WIDTH = LINE_WIDTH * DPI / 72 / 2
+# Furthest a line's pixels reach from its centre, counting one pixel of anti-aliasing
+LINE_REACH = math.ceil(LINE_HALF_WIDTH) + 1
+
+# ((x1, y1), (x2, y2)) line segment in pixels, measured from the top left of the image
+Segment = Tuple[Tuple[float, float], Tuple[float, float]]
+# (node, x, y, dx, dy, direction, first_pass) for every node or team logo drawn by `Bracket.draw_bracket`
+LayoutEntry = Tuple[Union[BracketNode, Team], float, float, float, float, int, bool]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_logo(name: str, size: Tuple[int, int]) -> np.ndarray:
+    """
+    Loads a team logo resized to the given dimensions, caching the result since logos never change.
+
+    :param name: Team name matching a file in `team_logos/` (spaces in place of underscores).
+    :param size: Target (width, height) of the logo in pixels.
+    :returns: The logo as a read-only RGBA pixel array.
+    """
+    with Image.open(f"team_logos/{name.replace(' ', '_')}.png") as img:
+        logo = np.asarray(img.convert('RGBA').resize(size), dtype=np.uint8)
+    # The same array is shared by every render, so guard it against accidental modification
+    logo.flags.writeable = False
+    return logo
+
+
+@functools.lru_cache(maxsize=None)
+def _get_placeholder(size: Tuple[int, int]) -> np.ndarray:
+    """
+    Builds a plain grey square shown in place of a logo for matchups with no winner yet.
+
+    :param size: Target (width, height) of the placeholder in pixels.
+    :returns: The placeholder as a read-only RGBA pixel array.
+    """
+    placeholder = np.full((size[1], size[0], 4), 200, dtype=np.uint8)
+    placeholder.flags.writeable = False
+    return placeholder
+
+
+# A layer is a full-size RGBA canvas and the final's direction changes its geometry, so only keep the
+# few layers in use at once: gray and red for each way the final can be drawn
+@functools.lru_cache(maxsize=4)
+def _line_layer(segments: Tuple[Segment, ...], colour: str) -> np.ndarray:
+    """
+    Renders connection lines in a single colour on a blank canvas, caching the result.
+
+    Brackets of the same shape share their line geometry, so each layer is rendered by matplotlib once
+    and then reused as a pixel source by every `Bracket.draw_bracket` call.
+
+    :param segments: Line segments to draw, in pixels.
+    :param colour: Colour of every line.
+    :returns: The rendered canvas as a read-only RGBA pixel array.
+    """
+    # A standalone Figure stays out of pyplot's global figure manager, so it is freed once rendered
+    fig = Figure(
+        figsize=(IMG_WIDTH / DPI, IMG_HEIGHT / DPI),
+        dpi=DPI
+    )
+    canvas = FigureCanvasAgg(fig)
+
+    segs_fig = np.array(segments, dtype=float).reshape(-1, 2, 2) / (IMG_WIDTH, IMG_HEIGHT)
+    segs_fig[..., 1] = 1 - segs_fig[..., 1]
+    fig.add_artist(LineCollection(segs_fig, colors=colour,
+                                  linewidths=LINE_WIDTH, transform=fig.transFigure))
+    canvas.draw()
+
+    layer = np.array(canvas.buffer_rgba())
+    layer.flags.writeable = False
+    return layer
 
 
 def draw_connection(draw_seg, x, y, dx, dy, direction, colours):
     """
     Draws the three‐segment connection lines between bracket nodes.
 
-    :param draw_seg: Callable that draws a single line segment.
+    :param draw_seg: Callable that draws a single line segment in the given colour.
     :param x: X coordinate of the origin point in pixels.
     :param y: Y coordinate of the origin point in pixels.
     :param dx: Horizontal offset for the branch in pixels.
@@ -41,7 +115,7 @@ def draw_connection(draw_seg, x, y, dx, dy, direction, colours):
 
     # 1) center horizontal
     draw_seg(x, y, x + direction * dx / 2, y,
-             color=colours['center'], linewidth=1)
+             colours['center'])
 
     # 2) branch out to top and bottom
     for branch, col in (('top', colours['top']),
@@ -50,17 +124,23 @@ def draw_connection(draw_seg, x, y, dx, dy, direction, colours):
         # vertical
         draw_seg(x + direction * dx / 2, y,
                  x + direction * dx / 2, y_off,
-                 color=col, linewidth=1)
+                 col)
         # horizontal
         draw_seg(x + direction * dx / 2, y_off,
                  x + direction * dx,    y_off,
-                 color=col, linewidth=1)
+                 col)
 
 
 class Bracket:
     """
     Represents an entire playoff bracket as a tree of BracketNode.
     """
+    # Drawing geometry, fixed by the Stanley Cup format: each half of the image holds one column per round,
+    # counting the final at the centre, plus one for the team logos
+    _NUM_COLUMNS = max(Round) + 1
+    _DX = IMG_WIDTH / (2 * _NUM_COLUMNS)
+    _BASE_DY = IMG_HEIGHT / (2 * sum(1 / i for i in range(1, _NUM_COLUMNS)))
+
     def __init__(self, root: BracketNode, name: str):
         """
         Initializes a `Bracket` instance.
@@ -72,6 +152,14 @@ class Bracket:
         self.root = root
         self.name = name
 
+        # Cached result of `nodes`; the tree's shape never changes after construction
+        self._nodes: Optional[Tuple[BracketNode, ...]] = None
+        # Cached result of `_round_traversal_order`
+        self._round_order: Optional[Tuple[Tuple[Round, Tuple[int, ...]], ...]] = None
+
+        # Cached result of `layout`
+        self._layout: Optional[List[LayoutEntry]] = None
+
     @classmethod
     def from_team_list(cls, teams: List[Team], name: str) -> 'Bracket':
         """
@@ -133,120 +221,225 @@ class Bracket:
 
         return cls(root=final_node, name=name)
 
-    def collect_nodes_by_round(self) -> Dict[Round, List[BracketNode]]:
+    def fresh_copy(self, name: str) -> 'Bracket':
         """
-        Traverses the bracket tree and groups nodes by their round.
+        Creates a new bracket with the same matchups as this one and no winners picked.
+
+        The `Team`s are shared rather than copied, since they are never modified.
 
-        :returns: A dict mapping each `Round` to the list of `BracketNode`s in that round.
+        :param name: Name to assign to the new bracket.
+        :returns: A new `Bracket` instance with its own `BracketNode`s.
         """
-        rounds: Dict[Round, List[BracketNode]] = defaultdict(list)
+        copies: Dict[BracketNode, BracketNode] = {}
+        # Children come after their parents in `nodes`, so walking it backwards copies them first
+        for node in reversed(self.nodes):
+            top = copies[node.top] if isinstance(node.top, BracketNode) else node.top
+            bottom = copies[node.bottom] if isinstance(node.bottom, BracketNode) else node.bottom
+            copies[node] = BracketNode(node.round, top, bottom)
+
+        # The copy has the same shape, so it inherits both traversal orders rather than walking its tree
+        bracket = type(self)(copies[self.root], name)
+        bracket._nodes = tuple(copies[node] for node in self.nodes)
+        bracket._round_order = self._round_traversal_order()
+        return bracket
+
+    @property
+    def nodes(self) -> Tuple[BracketNode, ...]:
+        """
+        Every `BracketNode` in the bracket tree in depth‐first order, computed once and cached.
 
-        def dfs(node: BracketNode):
-            rounds[node.round].append(node)
-            if isinstance(node.top, BracketNode):
-                dfs(node.top)
-            if isinstance(node.bottom, BracketNode):
-                dfs(node.bottom)
+        Brackets of the same shape list their nodes in the same order, so two brackets can be compared by
+        zipping their `nodes`.
 
-        dfs(self.root)
-        return rounds
+        :returns: A tuple of the bracket's nodes, starting at the root.
+        """
+        if self._nodes is None:
+            nodes = []
+            stack = [self.root]
+            while stack:
+                node = stack.pop()
+                nodes.append(node)
+                if isinstance(node.top, BracketNode):
+                    stack.append(node.top)
+                if isinstance(node.bottom, BracketNode):
+                    stack.append(node.bottom)
+            self._nodes = tuple(nodes)
+        return self._nodes
+
+    def _round_traversal_order(self) -> Tuple[Tuple[Round, Tuple[int, ...]], ...]:
+        """
+        Plans the round-by-round visiting order as positions in `nodes`, computed once and cached.
+
+        The plan depends only on the bracket's shape, so copies made by `fresh_copy` inherit it.
+
+        :returns: (round, node indices) pairs in round order, each listing the round's nodes top to bottom.
+        """
+        if self._round_order is None:
+            index = {node: i for i, node in enumerate(self.nodes)}
+            rounds: Dict[Round, List[int]] = defaultdict(list)
+
+            stack = [self.root]
+            while stack:
+                node = stack.pop()
+                rounds[node.round].append(index[node])
+                # Push bottom first so the top subtree is visited first
+                if isinstance(node.bottom, BracketNode):
+                    stack.append(node.bottom)
+                if isinstance(node.top, BracketNode):
+                    stack.append(node.top)
+
+            self._round_order = tuple((rnd, tuple(rounds[rnd])) for rnd in sorted(rounds))
+        return self._round_order
+
+    def collect_nodes_by_round(self) -> List[Tuple[Round, List[BracketNode]]]:
+        """
+        Groups the bracket's nodes by their round.
+
+        :returns: (round, nodes) pairs in round order, each listing the `BracketNode`s in that round.
+        """
+        nodes = self.nodes
+        return [
+            (rnd, [nodes[i] for i in indices])
+            for rnd, indices in self._round_traversal_order()
+        ]
 
     def draw_bracket(self, filename: str,
                      colour_lines: bool = False,
-                     league: "League" = None):
+                     league: "League" = None,
+                     incorrect_predictions: Optional[Dict[BracketNode, str]] = None):
         """
         Renders and saves the bracket visualization including team logos and optional colouring.
 
         :param filename: Name of the output PNG file (saved under `bracket_results/`).
         :param colour_lines: If True, highlights incorrect predictions in red.
         :param league: A `League` instance used to check and colour incorrect lines.
+        :param incorrect_predictions: Incorrect branches from `League.compare`, if already known, used
+            instead of checking the bracket against `league` again.
         :returns: None
         """
-        rounds = self.collect_nodes_by_round()
-
-        fig = plt.figure(
-            figsize=(IMG_WIDTH / DPI, IMG_HEIGHT / DPI),
-            dpi=DPI
-        )
-        ax = fig.add_axes((0, 0, 1, 1))
-        ax.axis('off')
+        segments: List[Segment] = []
+        red_segments: List[Segment] = []
 
-        def draw_seg(x1, y1, x2, y2, **line_kwargs):
+        def draw_seg(x1, y1, x2, y2, colour):
             """
-            Local helper for drawing line segments
+            Local helper for accumulating line segments, which are drawn together after the traversal
 
             :param x1: x coordinate at start of line segment
             :param y1: y coordinate at start of line segment
             :param x2: x coordinate at end of line segment
             :param y2: y coordinate at end of line segment
-            :param line_kwargs: line width and colour
+            :param colour: line colour, either 'gray' or 'red'
             """
-            fx1, fy1 = x1 / IMG_WIDTH, 1 - (y1 / IMG_HEIGHT)
-            fx2, fy2 = x2 / IMG_WIDTH, 1 - (y2 / IMG_HEIGHT)
-            line = Line2D([fx1, fx2], [fy1, fy2],
-                          transform=fig.transFigure, **line_kwargs)
-            fig.add_artist(line)
-
-        num_rounds = max(rounds.keys()) + 1
-        dx = IMG_WIDTH / (2 * num_rounds)
-        base_dy = IMG_HEIGHT / (2 * sum(1 / i for i in range(1, num_rounds)))
-
-        incorrect_predictions = {}
-        if colour_lines and league:
-            incorrect_predictions = league.check_bracket(self)
-
-        def dfs(node: Union[BracketNode, Team],
-                x, y,
-                dy: float = base_dy,
-                first_pass: bool = False):
+            segments.append(((x1, y1), (x2, y2)))
+            if colour == 'red':
+                red_segments.append(((x1, y1), (x2, y2)))
+
+        if not colour_lines:
+            incorrect_predictions = {}
+        elif incorrect_predictions is None:
+            incorrect_predictions = league.check_bracket(self) if league else {}
+
+        logos = []
+        for node, x, y, dx, dy, direction, first_pass in self.layout():
+            img_size = (150, 150) if first_pass else (50, 50)
+            if isinstance(node, BracketNode) and node.winner is None:
+                # Undecided matchup: nothing has advanced, so skip its lines and show a placeholder
+                logos.append((_get_placeholder(img_size), x, y))
+                continue
+
             if isinstance(node, BracketNode):
-                conf = node.winner.conference
+                if first_pass:
+                    # The final's line leads towards the conference of the Stanley Cup winner
+                    direction = +1 if node.winner.conference == "East" else -1
                 top_line_colour = bottom_line_colour = 'gray'
                 if node in incorrect_predictions:
                     top_line_colour = 'red' if 'top' in incorrect_predictions[node] else 'gray'
                     bottom_line_colour = 'red' if 'bottom' in incorrect_predictions[node] else 'gray'
+                center_colour = top_line_colour if top_line_colour == bottom_line_colour else 'red'
 
                 if first_pass:
-                    direction = +1 if conf == "East" else -1
-                    center_colour = top_line_colour if top_line_colour == bottom_line_colour else "red"
-                    draw_connection(
-                        draw_seg, x, y, dx, 0, direction,
-                        {'center': center_colour, 'top': center_colour, 'bottom': center_colour}
-                    )
-
-                    dfs(node.top,    x - dx, y,      dy)
-                    dfs(node.bottom, x + dx, y,      dy)
+                    colours = {'center': center_colour, 'top': center_colour, 'bottom': center_colour}
                 else:
-                    direction = +1 if conf == "East" else -1
-                    draw_connection(
-                        draw_seg, x, y, dx, dy, direction,
-                        {'center': top_line_colour if top_line_colour == bottom_line_colour else 'red',
-                         'top':    top_line_colour,
-                         'bottom': bottom_line_colour}
-                    )
-                    dfs(node.top,    x + direction * dx, y - dy, dy / 2)
-                    dfs(node.bottom, x + direction * dx, y + dy, dy / 2)
-
-            # Draw team logo
-            img_size = (150, 150) if first_pass else (50, 50)
-            if isinstance(node, BracketNode):
-                img_path = f"team_logos/{node.winner.name.replace(' ', '_')}.png"
-            else:
-                img_path = f"team_logos/{node.name.replace(' ', '_')}.png"
-
-            img = Image.open(img_path).resize(img_size)
-            fx = (x - img_size[0] / 2) / IMG_WIDTH
-            fy = 1 - ((y + img_size[1] / 2) / IMG_HEIGHT)
-            logo_ax = fig.add_axes(
-                (fx, fy, img_size[0] / IMG_WIDTH, img_size[1] / IMG_HEIGHT),
-                facecolor='none', frameon=False, zorder=2
+                    colours = {'center': center_colour, 'top': top_line_colour, 'bottom': bottom_line_colour}
+                draw_connection(draw_seg, x, y, dx, dy, direction, colours)
+
+            team_name = node.winner.name if isinstance(node, BracketNode) else node.name
+            logos.append((_get_logo(team_name, img_size), x, y))
+
+        # Only the final's line direction depends on the picks, so the gray and red renders of the lines
+        # are shared with every other bracket. Start from the gray lines and copy in the red ones.
+        all_segments = tuple(segments)
+        pixels = np.array(_line_layer(all_segments, 'gray'))
+        if red_segments:
+            red_pixels = _line_layer(all_segments, 'red')
+            for (x1, y1), (x2, y2) in red_segments:
+                top, bottom = sorted((round(y1), round(y2)))
+                left, right = sorted((round(x1), round(x2)))
+                # Segments are horizontal or vertical and only meet at their ends. Copy the body of
+                # the line end to end, then widen across it to pick up its anti-aliased edges, stopping
+                # short of both ends by as much so the gray lines joining there are left alone.
+                for across, trim in ((int(LINE_HALF_WIDTH), 0), (LINE_REACH, LINE_REACH)):
+                    if top == bottom:
+                        rows = slice(max(top - across, 0), top + across + 1)
+                        cols = slice(left + trim, right - trim + 1)
+                    else:
+                        rows = slice(top + trim, bottom - trim + 1)
+                        cols = slice(max(left - across, 0), left + across + 1)
+                    pixels[rows, cols] = red_pixels[rows, cols]
+
+        # Draw team logos on top of the lines
+        img = Image.fromarray(pixels)
+        for logo, x, y in logos:
+            height, width = logo.shape[:2]
+            img.alpha_composite(
+                Image.fromarray(logo),
+                dest=(int(x - width / 2), int(y - height / 2))
             )
-            logo_ax.imshow(np.array(img))
-            logo_ax.axis('off')
 
-        dfs(self.root, IMG_WIDTH / 2, IMG_HEIGHT / 2, first_pass=True)
+        img.save(Path("bracket_results") / filename)
+
+    def layout(self) -> List[LayoutEntry]:
+        """
+        Computes the pixel position of every node and team logo in the bracket drawing.
+
+        Positions depend only on the shape of the bracket, not on its picks, so the result is cached and
+        reused by every later `draw_bracket` call.
+
+        :returns: A list of (node, x, y, dx, dy, direction, first_pass) entries in drawing order. `dx`, `dy`
+                  and `direction` are passed to `draw_connection`, and `first_pass` marks the Stanley Cup
+                  Final, whose direction (0 here) depends on its winner.
+        """
+        if self._layout is not None:
+            return self._layout
+
+        dx = self._DX
+
+        def conference_of(node: BracketNode) -> str:
+            # Every team below a node below the final plays in the same conference
+            while isinstance(node, BracketNode):
+                node = node.top
+            return node.conference
+
+        entries: List[LayoutEntry] = []
+        # Stack entries are (node, x, y, dy, first_pass); bottom is pushed first so top is drawn first
+        stack = [(self.root, IMG_WIDTH / 2, IMG_HEIGHT / 2, self._BASE_DY, True)]
+        while stack:
+            node, x, y, dy, first_pass = stack.pop()
+            if not isinstance(node, BracketNode):
+                entries.append((node, x, y, dx, dy, 0, first_pass))
+            elif first_pass:
+                # The final branches straight out to each conference
+                entries.append((node, x, y, dx, 0, 0, first_pass))
+                stack.append((node.bottom, x + dx, y, dy, False))
+                stack.append((node.top,    x - dx, y, dy, False))
+            else:
+                direction = +1 if conference_of(node) == "East" else -1
+                entries.append((node, x, y, dx, dy, direction, first_pass))
+                stack.append((node.bottom, x + direction * dx, y + dy, dy / 2, False))
+                stack.append((node.top,    x + direction * dx, y - dy, dy / 2, False))
 
-        plt.savefig(Path("bracket_results") / filename)
+        self._layout = entries
+        return entries
 
     def __str__(self) -> str:
         """
@@ -254,27 +447,26 @@ class Bracket:
 
         :returns: Multi‐line string listing each matchup by round and the final winner.
         """
-        def describe_matchup(n: BracketNode) -> str:
-            def name_of(side):
-                if isinstance(side, Team):
-                    return side.name
-                elif side.winner is not None:
-                    return side.winner.name
-                top = name_of(side.top)
-                bottom = name_of(side.bottom)
-                return f"Winner of ({top} vs {bottom})"
-
-            return f"  {name_of(n.top)} vs {name_of(n.bottom)}"
+        # Matchup text per node. Rounds are described in order, so each side's earlier matchup is
+        # already here and "Winner of (...)" strings are built once instead of by re-walking subtrees.
+        matchups: Dict[BracketNode, str] = {}
 
-        rounds = self.collect_nodes_by_round()
+        def name_of(side: Union[BracketNode, Team]) -> str:
+            if isinstance(side, Team):
+                return side.name
+            elif side.winner is not None:
+                return side.winner.name
+            return f"Winner of ({matchups[side]})"
 
         lines = []
-        for rnd in sorted(rounds):
+        for rnd, nodes in self.collect_nodes_by_round():
             lines.append(f"Round {rnd.name}:")
-            for node in rounds[rnd]:
-                lines.append(describe_matchup(node))
+            for node in nodes:
+                matchups[node] = f"{name_of(node.top)} vs {name_of(node.bottom)}"
+                lines.append(f"  {matchups[node]}")
 
-        stanley_cup_winner = rounds[Round.STANLEY_CUP_FINALS][0].winner
+        # The root is the Stanley Cup Final
+        stanley_cup_winner = self.root.winner
         if stanley_cup_winner is not None:
             lines.append(f"The {stanley_cup_winner.name} win the stanley cup!")
 
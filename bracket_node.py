@@ -6,7 +6,7 @@ Each node holds two competitors (either two `Team` instances, or two `BracketNod
 which each have some winner) and records the winner.
 """
 
-import uuid
+import itertools
 from round import Round
 from team import Team
 from typing import Union, Optional
@@ -16,6 +16,11 @@ class BracketNode:
     Node in a playoff bracket tree. Holds two sides (either Team or BracketNode), the round,
     and records the winner once known.
     """
+    __slots__ = ("round", "top", "bottom", "_uid", "winner")
+
+    # Source of unique per-node identifiers
+    _id_counter = itertools.count()
+
     def __init__(
 
         self,
@@ -35,7 +40,7 @@ class BracketNode:
         self.top = top
         self.bottom = bottom
 
-        self._uid: uuid.UUID = uuid.uuid4()
+        self._uid: int = next(BracketNode._id_counter)
 
         self.winner: Optional[Team] = None
 
@@ -43,9 +48,18 @@ class BracketNode:
         """
         Enables usage in sets and as dict keys.
 
-        :returns: Hash based on the node's UUID.
+        :returns: Hash based on the node's unique integer id.
+        """
+        return self._uid
+
+    @property
+    def resolved_winner(self) -> Optional[Team]:
+        """
+        The team that advanced from this matchup, matching `Team.resolved_winner`.
+
+        :returns: The winning `Team`, or None if no winner has been set.
         """
-        return hash(self._uid)
+        return self.winner
 
     def set_winner(self, team: Team) -> None:
         """
@@ -65,7 +79,7 @@ class BracketNode:
 
         :returns: The `Team` at the top side, may be None if winner not set.
         """
-        return self.top if isinstance(self.top, Team) else self.top.winner  # may be None
+        return self.top.resolved_winner  # may be None
 
     def _leaf_bottom(self) -> Team:
         """
@@ -73,4 +87,4 @@ class BracketNode:
 
         :returns: The `Team` at the bottom side, may be None if winner not set.
         """
-        return self.bottom if isinstance(self.bottom, Team) else self.bottom.winner  # may be None
+        return self.bottom.resolved_winner  # may be None
@@ -5,12 +5,15 @@ Defines the `League` class for managing a fantasy‐style playoff pool, includin
 and leaderboard generation.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from bracket_node import BracketNode
 from round import Round
 from bracket import Bracket
 
+# (total score, dict of incorrect `BracketNode`s to 'top'/'bottom') for one predicted bracket
+Comparison = Tuple[int, Dict[BracketNode, str]]
+
 
 def traverse_nodes(bracket: Bracket):
     """
@@ -19,14 +22,7 @@ def traverse_nodes(bracket: Bracket):
     :param bracket: A `Bracket` instance to traverse.
     :yields: Each `BracketNode` encountered.
     """
-    stack = [bracket.root]
-    while stack:
-        node = stack.pop()
-        yield node
-        if isinstance(node.top, BracketNode):
-            stack.append(node.top)
-        if isinstance(node.bottom, BracketNode):
-            stack.append(node.bottom)
+    yield from bracket.nodes
 
 
 class League:
@@ -54,6 +50,36 @@ class League:
         self.brackets = brackets
         self.correct_bracket = correct_bracket
 
+    def compare(self, predicted: Bracket) -> Comparison:
+        """
+        Walks the correct and predicted brackets together once, scoring and checking in the same pass.
+
+        Callers that need both the score and the incorrect branches, such as `leaderboard` followed by
+        `Bracket.draw_bracket`, can compare once and pass the result along.
+
+        :param predicted: A player's `Bracket` with picks filled in.
+        :returns: A tuple of (total score, dict of incorrect `BracketNode`s to 'top'/'bottom').
+        """
+        total = 0
+        incorrect: Dict[BracketNode, str] = dict()
+        points_per_round = self.points_per_round
+
+        for actual_node, pred_node in zip(self.correct_bracket.nodes, predicted.nodes):
+            actual_winner = actual_node.winner
+            pred_winner = pred_node.winner
+            if actual_winner is None or pred_winner is None:
+                continue
+            if pred_winner is actual_winner or pred_winner == actual_winner:
+                total += points_per_round[actual_node.round]
+                continue
+
+            # The incorrect pick came from whichever side the predicted winner advanced from
+            top = pred_node.top
+            top_team = top.winner if isinstance(top, BracketNode) else top
+            incorrect[pred_node] = "top" if top_team == pred_winner else "bottom"
+
+        return total, incorrect
+
     def score_bracket(self, predicted: Bracket) -> int:
         """
         Computes the total score for a predicted bracket.
@@ -61,15 +87,7 @@ class League:
         :param predicted: A player's `Bracket` with picks filled in.
         :returns: Total integer score based on correct picks.
         """
-        total = 0
-        for actual_node, pred_node in zip(
-            traverse_nodes(self.correct_bracket),
-            traverse_nodes(predicted)
-        ):
-            if actual_node.winner and pred_node.winner:
-                if pred_node.winner.name == actual_node.winner.name:
-                    total += self.points_per_round[actual_node.round]
-        return total
+        return self.compare(predicted)[0]
 
     def check_bracket(self, predicted: Bracket) -> Dict[BracketNode, str]:
         """
@@ -78,39 +96,22 @@ class League:
         :param predicted: A player's `Bracket` to compare against `self.correct_bracket`.
         :returns: A dict mapping each incorrect `BracketNode` to a list of 'top'/'bottom' keys that were incorrect.
         """
-        incorrect: Dict[BracketNode, str] = dict()
+        return self.compare(predicted)[1]
 
-        for actual_node, pred_node in zip(
-            traverse_nodes(self.correct_bracket),
-            traverse_nodes(predicted)
-        ):
-            if actual_node.winner and pred_node.winner:
-                if pred_node.winner.name != actual_node.winner.name:
-                    # BracketNode children
-                    if isinstance(pred_node.top, BracketNode):
-                        if (
-                            pred_node.top.winner.name != actual_node.winner.name
-                            and pred_node.top.winner.name == pred_node.winner.name
-                        ):
-                            incorrect[pred_node] = "top"
-                        else:
-                            incorrect[pred_node] = "bottom"
-                    # Leaf-team children
-                    else:
-                        if pred_node.top.name == pred_node.winner.name:
-                            incorrect[pred_node] = "top"
-                        else:
-                            incorrect[pred_node] = "bottom"
-
-        return incorrect
-
-    def leaderboard(self) -> List[Tuple[int, Bracket, int]]:
+    def leaderboard(
+        self,
+        comparisons: Optional[Dict[Bracket, Comparison]] = None
+    ) -> List[Tuple[int, Bracket, int]]:
         """
         Generates a sorted leaderboard of player scores.
 
+        :param comparisons: Results of `compare` for every bracket, if already computed; otherwise each
+            bracket is scored here.
         :returns: A list of tuples (rank, Bracket, score), sorted by score descending.
         """
-        scores = {br: self.score_bracket(br) for br in self.brackets}
+        if comparisons is None:
+            comparisons = {br: self.compare(br) for br in self.brackets}
+        scores = {br: comparisons[br][0] for br in self.brackets}
         sorted_scores = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
 
         ranked: List[Tuple[int, Bracket, int]] = []
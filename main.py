@@ -11,15 +11,41 @@ This script allows users to:
 
 """
 
+from __future__ import annotations
 
-import copy
-from bracket import Bracket
-from bracket_node import BracketNode
-from league import League
-from pathlib import Path
+import functools
+import os
 from round import Round
 from team import Team
-from typing import Dict, List, Set, Tuple
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Set, Tuple
+
+if TYPE_CHECKING:
+    from bracket import Bracket
+    from bracket_node import BracketNode
+
+
+# Default 2025 playoff teams, built once; Team instances are never modified
+_DEFAULT_TEAMS_2025: Tuple[Team, ...] = (
+    Team("Toronto Maple Leafs",  1, "East"),
+    Team("Tampa Bay Lightning",  2, "East"),
+    Team("Washington Capitals",  3, "East"),
+    Team("Carolina Hurricanes",  4, "East"),
+    Team("New Jersey Devils",    5, "East"),
+    Team("Montreal Canadiens",   6, "East"),
+    Team("Florida Panthers",     7, "East"),
+    Team("Ottawa Senators",      8, "East"),
+    Team("Winnipeg Jets",        1, "West"),
+    Team("Dallas Stars",         2, "West"),
+    Team("Vegas Golden Knights", 3, "West"),
+    Team("Los Angeles Kings",    4, "West"),
+    Team("Edmonton Oilers",      5, "West"),
+    Team("Minnesota Wild",       6, "West"),
+    Team("Colorado Avalanche",   7, "West"),
+    Team("St Louis Blues",       8, "West"),
+)
+
+# Display name of each round, e.g. 'Conference Finals'
+_ROUND_LABELS: Dict[Round, str] = {rnd: rnd.name.replace('_', ' ').title() for rnd in Round}
 
 
 def create_league() -> None:
@@ -37,6 +63,11 @@ def create_league() -> None:
     league_name = input("Enter the league name: ")
     teams = prompt_team_list()
 
+    # Imported here rather than at module level so the first prompts are not held up by
+    # matplotlib and PIL, which the bracket modules load
+    from bracket import Bracket
+    from league import League
+
     empty_bracket = Bracket.from_team_list(teams, "empty")
     print("\nGenerated Initial Playoff Bracket:\n")
     print(empty_bracket)
@@ -44,8 +75,7 @@ def create_league() -> None:
     brackets = get_player_brackets(empty_bracket)
 
     print("---- Enter the results of the playoffs ----")
-    correct_bracket = copy.deepcopy(empty_bracket)
-    correct_bracket.name = "correct"
+    correct_bracket = empty_bracket.fresh_copy("correct")
     prompt_picks(correct_bracket)
 
     # Save the correct bracket image
@@ -60,17 +90,22 @@ def create_league() -> None:
         correct_bracket=correct_bracket
     )
 
-    league_leaderboard = league.leaderboard()
-    # Output standings and save each player's bracket
+    # Compare each bracket once, for both its score and the red lines in its drawing
+    comparisons = {bracket: league.compare(bracket) for bracket in brackets}
+    league_leaderboard = league.leaderboard(comparisons)
+    # Output standings, then save each player's bracket
     print(f"--- {league.name} Scoreboard ---")
-    for rank, bracket, score in league_leaderboard:
-        print(f"{rank}, {bracket.name} with {score} points")
+    print("\n".join(
+        f"{rank}, {bracket.name} with {score} points"
+        for rank, bracket, score in league_leaderboard
+    ))
+    for _, bracket, _ in league_leaderboard:
         bracket.draw_bracket(
             filename=f"{bracket.name}_Bracket.png",
             colour_lines=True,
-            league=league
+            incorrect_predictions=comparisons[bracket][1]
         )
-    print(f"Bracket results available at {Path.cwd() / 'bracket_results'}")
+    print(f"Bracket results available at {os.path.join(os.getcwd(), 'bracket_results')}")
 
 
 def ask_choice(prompt: str, choices: Tuple[str, str]) -> str:
@@ -82,11 +117,12 @@ def ask_choice(prompt: str, choices: Tuple[str, str]) -> str:
     :returns: The user's choice (one of the provided options).
     """
     prompt_str = f"{prompt} ({'/'.join(choices)}): "
+    err_str = f"Please choose one of {choices}."
     while True:
         response = input(prompt_str).strip().lower()
         if response in choices:
             return response
-        print(f"Please choose one of {choices}.")
+        print(err_str)
 
 
 def load_default_teams() -> List[Team]:
@@ -100,24 +136,23 @@ def load_default_teams() -> List[Team]:
 
     :returns: A list of Team instances.
     """
-    return [
-        Team("Toronto Maple Leafs",  1, "East"),
-        Team("Tampa Bay Lightning",  2, "East"),
-        Team("Washington Capitals",  3, "East"),
-        Team("Carolina Hurricanes",  4, "East"),
-        Team("New Jersey Devils",    5, "East"),
-        Team("Montreal Canadiens",   6, "East"),
-        Team("Florida Panthers",     7, "East"),
-        Team("Ottawa Senators",      8, "East"),
-        Team("Winnipeg Jets",        1, "West"),
-        Team("Dallas Stars",         2, "West"),
-        Team("Vegas Golden Knights", 3, "West"),
-        Team("Los Angeles Kings",    4, "West"),
-        Team("Edmonton Oilers",      5, "West"),
-        Team("Minnesota Wild",       6, "West"),
-        Team("Colorado Avalanche",   7, "West"),
-        Team("St Louis Blues",       8, "West"),
-    ]
+    return list(_DEFAULT_TEAMS_2025)
+
+
+@functools.lru_cache(maxsize=1)
+def _valid_logo_names() -> FrozenSet[str]:
+    """
+    Scan the logo directory once for the team names that have a logo.
+
+    :returns: A frozenset of team names, with underscores in the filenames replaced by spaces.
+    """
+    logo_directory = "team_logos"
+    with os.scandir(logo_directory) as entries:
+        return frozenset(
+            os.path.splitext(entry.name)[0].replace('_', ' ')
+            for entry in entries
+            if entry.is_file(follow_symlinks=False) and not entry.name.startswith('.')
+        )
 
 
 def prompt_custom_teams() -> List[Team]:
@@ -128,21 +163,20 @@ def prompt_custom_teams() -> List[Team]:
 
     :returns: A list of Team instances.
     """
-    logo_directory = "team_logos"
-    valid = set(f.stem.replace('_', ' ') for f in Path(logo_directory).iterdir())
+    # Lowercased name -> name as spelled in the logo filename; names are removed as they are picked
+    valid = {name.lower(): name for name in _valid_logo_names()}
 
     teams: List[Team] = []
     for conf in ("East", "West"):
         for seed in range(1, 9):
             while True:
-                name = input(
+                key = input(
                     f"Enter seed {seed} of the {conf}ern Conference: "
-                ).strip().title()
-                if name in valid:
-                    teams.append(Team(name, seed, conf))
-                    valid.remove(name)
+                ).strip().lower()
+                if key in valid:
+                    teams.append(Team(valid.pop(key), seed, conf))
                     break
-                print(f"Invalid or duplicated name. Choose from: {', '.join(valid)}")
+                print(f"Invalid or duplicated name. Choose from: {', '.join(sorted(valid.values()))}")
     return teams
 
 def prompt_team_list() -> List[Team]:
@@ -169,15 +203,12 @@ def get_player_brackets(empty_bracket: Bracket) -> List[Bracket]:
     :param empty_bracket: A Bracket instance with no winners set.
     :returns: A list of Bracket instances populated with each player's picks.
     """
+    # Validate with str.isdecimal (the digits int() accepts) rather than catching int()'s ValueError
     while True:
-        try:
-            num_brackets = int(
-                input("Enter the number of players in the Fantasy League: ")
-            )
-            if num_brackets > 0:
-                break
-        except ValueError:
-            pass
+        response = input("Enter the number of players in the Fantasy League: ").strip()
+        if response.isdecimal() and int(response) > 0:
+            num_brackets = int(response)
+            break
         print("The number of players in the league must be a positive integer! Try again")
     names: Set[str] = set()
     brackets: List[Bracket] = []
@@ -192,8 +223,7 @@ def get_player_brackets(empty_bracket: Bracket) -> List[Bracket]:
                 break
             print("Player names must be non-empty and unique!")
 
-        bracket = copy.deepcopy(empty_bracket)
-        bracket.name = player_name
+        bracket = empty_bracket.fresh_copy(player_name)
         print(f"---- Picks for {bracket.name} ----")
         prompt_picks(bracket)
         brackets.append(bracket)
@@ -210,20 +240,20 @@ def prompt_pick(node: BracketNode) -> Team:
     :param node: A BracketNode representing the matchup.
     :returns: The chosen Team instance.
     """
-    while node.winner is None:
-        team_a = node.top if isinstance(node.top, Team) else node.top.winner
-        team_b = node.bottom if isinstance(node.bottom, Team) else node.bottom.winner
-
-        choice = input(f"Winner of {team_a.name} (A) vs {team_b.name} (B)?: ").strip().upper()
-        if choice == "A":
-            node.set_winner(team_a)
-        elif choice == "B":
-            node.set_winner(team_b)
-        else:
-            print(
-                f"Error: enter 'A' for {team_a.name} or 'B' for {team_b.name}."
-            )
-    return node.winner
+    if node.winner is not None:
+        return node.winner
+
+    team_a = node.top.resolved_winner
+    team_b = node.bottom.resolved_winner
+    prompt_str = f"Winner of {team_a.name} (A) vs {team_b.name} (B)?: "
+    err_str = f"Error: enter 'A' for {team_a.name} or 'B' for {team_b.name}."
+    choices = {"A": team_a, "B": team_b}
+    while True:
+        winner = choices.get(input(prompt_str).strip().upper())
+        if winner is not None:
+            node.set_winner(winner)
+            return winner
+        print(err_str)
 
 
 def prompt_picks(bracket: Bracket) -> None:
@@ -233,9 +263,8 @@ def prompt_picks(bracket: Bracket) -> None:
     :param bracket: A Bracket instance whose nodes will be populated with winners.
     :returns: None
     """
-    rounds = bracket.collect_nodes_by_round()
-    for rnd in sorted(rounds):
-        for node in rounds[rnd]:
+    for rnd, nodes in bracket.collect_nodes_by_round():
+        for node in nodes:
             prompt_pick(node)
 
 
@@ -246,21 +275,17 @@ def prompt_points() -> Dict[Round, int]:
     :returns: A mapping from Round enum to an integer point value for correct guesses in that Round.
     """
     points_prompt = "Enter the number of points awarded for a correct guess in the"
-    round_order = [
-        Round.FIRST_ROUND,
-        Round.SECOND_ROUND,
-        Round.CONFERENCE_FINALS,
-        Round.STANLEY_CUP_FINALS
-    ]
     results = {}
-    for rnd in round_order:
+    # Round is an IntEnum, so iterating it visits the rounds in playoff order
+    for rnd in Round:
+        round_prompt = f"{points_prompt} {_ROUND_LABELS[rnd]}: "
         while True:
-            try:
-                value = int(input(f"{points_prompt} {rnd.name.replace('_', ' ').title()}: "))
-                results[rnd] = value
+            response = input(round_prompt).strip()
+            digits = response[1:] if response[:1] in ("-", "+") else response
+            if digits.isdecimal():
+                results[rnd] = int(response)
                 break
-            except ValueError:
-                print("Invalid input. Please enter a valid integer.")
+            print("Invalid input. Please enter a valid integer.")
     return results
 
 
@@ -4,24 +4,54 @@ team.py
 Defines the `Team` class representing an NHL team with its seed and conference.
 """
 
+import sys
+from dataclasses import dataclass
 
+
+@dataclass(frozen=True)
 class Team:
     """
     Represents an NHL team.
+
+    Teams are immutable, so one instance can be shared by every bracket and compared or hashed by value.
+
+    :param name: Official team name (e.g., 'Toronto Maple Leafs').
+    :param seed: Numeric seed in the conference (1–8).
+    :param conference: Conference name ('East' or 'West').
     """
+    # Declared by hand rather than with `dataclass(slots=True)`, which needs Python 3.10
+    __slots__ = ("name", "seed", "conference")
 
-    def __init__(self, name: str, seed: int, conference: str) -> None:
+    name: str
+    seed: int
+    conference: str
+
+    def __post_init__(self) -> None:
         """
-        Initializes a `Team`.
+        Interns the name and conference so the many comparisons of them can short-circuit on identity.
 
-        :param name: Official team name (e.g., 'Toronto Maple Leafs').
-        :param seed: Numeric seed in the conference (1–8).
-        :param conference: Conference name ('East' or 'West').
         :returns: None
         """
-        self.name = name
-        self.seed = seed
-        self.conference = conference
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "conference", sys.intern(self.conference))
+
+    def __reduce__(self):
+        """
+        Rebuilds teams through `__init__` when pickled or copied, since frozen slots cannot be restored
+        by assignment.
+
+        :returns: The team's class and its constructor arguments.
+        """
+        return type(self), (self.name, self.seed, self.conference)
+
+    @property
+    def resolved_winner(self) -> 'Team':
+        """
+        The team occupying this side of a matchup, matching `BracketNode.resolved_winner`.
+
+        :returns: This team.
+        """
+        return self
 
     def __repr__(self) -> str:
         """